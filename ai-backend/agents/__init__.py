@@ -1,3 +1,3 @@
-from .data_agent import DataAgent, data_agent
+from .data_agent import DataAgent, get_data_agent
 
-__all__ = ["DataAgent", "data_agent"]
+__all__ = ["DataAgent", "get_data_agent"]
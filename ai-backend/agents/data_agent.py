@@ -1,32 +1,226 @@
 """
 Data Agent - Collects data from NestJS backend APIs
 """
+import asyncio
+import time
 import httpx
+import ijson
+import msgspec
+import orjson
+from collections import defaultdict
 from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta
 from config.settings import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class TaskRecord(msgspec.Struct, kw_only=True):
+    """Typed view of a backend task, limited to the fields preprocessing reads"""
+    id: Optional[int] = None
+    assignee_id: Optional[int] = None
+    status: Optional[str] = None
+    story_points: Optional[float] = None
+    complexity: Optional[float] = None
+    created_at: Optional[str] = None
+    created: Optional[str] = None
+    # parsed creation timestamp, filled in once after decode
+    created_dt: Optional[datetime] = None
+
+
+class UserRecord(msgspec.Struct, kw_only=True):
+    """Typed view of a backend user, limited to the fields preprocessing reads"""
+    id: Optional[int] = None
+    name: Optional[str] = None
+    email: Optional[str] = None
+    role: Optional[str] = None
+    team_id: Optional[int] = None
+    project_id: Optional[int] = None
+    skills: List[str] = []
+    availability: bool = True
+    joining_date: Optional[str] = None
+    experience_years: float = 0
+
+
+class Candidate(msgspec.Struct, kw_only=True):
+    """Per-user decision features for task assignment
+
+    A slotted struct is cheaper to construct and roughly half the memory of
+    the equivalent 14-key dict; msgspec.json.encode serializes it directly
+    for the LLM payload.
+    """
+    id: Optional[int] = None
+    name: Optional[str] = None
+    availability: bool = True
+    current_workload: int = 0
+    workload_story_points: float = 0
+    experience_years: float = 0
+    recent_assignments_count: int = 0
+    avg_task_complexity: float = 0.0
+    skill_match_score: float = 0.0
+    estimated_completion_confidence: float = 0.8
+    fairness_adjustment_score: float = 1.0
+    wellbeing_flag: bool = False
+    role: Optional[str] = None
+    deadline_urgency: float = 0.0
+
+
+# Reused across calls so decoder construction isn't paid per response
+_msgpack_decoder = msgspec.msgpack.Decoder()
+_task_list_decoders = (
+    msgspec.json.Decoder(List[TaskRecord], strict=False),
+    msgspec.msgpack.Decoder(List[TaskRecord], strict=False),
+)
+_user_list_decoders = (
+    msgspec.json.Decoder(List[UserRecord], strict=False),
+    msgspec.msgpack.Decoder(List[UserRecord], strict=False),
+)
+
+
+def _loads_typed(response: httpx.Response, decoders) -> Any:
+    """Decode a response body straight into msgspec structs (no dict round-trip)"""
+    json_decoder, msgpack_decoder = decoders
+    if "msgpack" in response.headers.get("content-type", ""):
+        return msgpack_decoder.decode(response.content)
+    return json_decoder.decode(response.content)
+
+
+# Shared pooled HTTP client; created lazily so it binds to the running event
+# loop rather than whatever loop (if any) exists at import time
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            headers={
+                "Accept": "application/msgpack, application/json",
+                "Accept-Encoding": "gzip, br",
+            }
+        )
+    return _shared_client
+
+
+# Skill intern table: lowercased skill name -> bit index, grown lazily.
+# Representing skill sets as int bitmasks makes intersection/union a couple
+# of CPU instructions (popcount) instead of hash-set operations.
+_SKILL_ID: Dict[str, int] = {}
+
+
+def _skill_mask(skills) -> int:
+    """Map a list of skill names to an int bitmask, interning new skills"""
+    mask = 0
+    for s in skills:
+        s = s.lower()
+        bit = _SKILL_ID.get(s)
+        if bit is None:
+            bit = _SKILL_ID[s] = len(_SKILL_ID)
+        mask |= 1 << bit
+    return mask
+
+
+def _safe_fromiso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp, returning None on missing/malformed input"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except Exception:
+        return None
+
+
+def _loads(response: httpx.Response) -> Any:
+    """Decode a backend response body
+
+    Uses MessagePack when the backend honours the negotiated Accept header
+    (smaller and faster to decode than JSON), falling back to orjson for
+    plain JSON responses.
+    """
+    if "msgpack" in response.headers.get("content-type", ""):
+        return _msgpack_decoder.decode(response.content)
+    return orjson.loads(response.content)
+
+
 class DataAgent:
     """Agent responsible for fetching and preprocessing data from backend APIs"""
-    
+
+    # Seconds a cached list response stays fresh. Long enough to dedupe the
+    # repeated fetches within a single decision, short enough that separate
+    # requests still see fresh data.
+    cache_ttl: float = 2.0
+    # Teams and projects change on a human timescale, so they get a much
+    # longer TTL than the task/user lists
+    slow_cache_ttl: float = 60.0
+    # Seconds an assembled decision context stays fresh per task_id, so retry
+    # bursts and duplicate submissions share one round of fetches
+    context_ttl: float = 30.0
+
     def __init__(self, backend_url: str = None):
         self.backend_url = backend_url or settings.nestjs_backend_url
-        self.client = httpx.AsyncClient(timeout=30.0)
-    
+        self._cache: Dict[str, Any] = {}
+        self._ctx_cache: Dict[int, Any] = {}
+        self._ctx_locks: Dict[int, asyncio.Lock] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP client (created lazily on the running loop)"""
+        return _get_client()
+
     async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        """Close the shared HTTP client"""
+        if _shared_client is not None and not _shared_client.is_closed:
+            await _shared_client.aclose()
+
+    async def _get_cached(self, url: str, decoders=None, params: Optional[Dict[str, Any]] = None,
+                          ttl: Optional[float] = None) -> Any:
+        """GET a list endpoint through a short TTL cache keyed by URL
+
+        Repeated calls within cache_ttl seconds (e.g. the duplicate /tasks
+        fetch during a single decision) are served from memory instead of
+        re-hitting the backend. Typed and dict decodes cache separately.
+        """
+        if params:
+            url = str(httpx.URL(url, params=params))
+        key = url if decoders is None else url + "#typed"
+        hit = self._cache.get(key)
+        now = time.monotonic()
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        response = await self.client.get(url)
+        response.raise_for_status()
+        value = _loads(response) if decoders is None else _loads_typed(response, decoders)
+        self._cache[key] = (now + (ttl if ttl is not None else self.cache_ttl), value)
+        return value
+
+    def invalidate(self):
+        """Drop all cached responses (call when backend data is known to have changed)"""
+        self._cache.clear()
+        self._ctx_cache.clear()
     
-    async def fetch_tasks(self, task_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    async def fetch_tasks(
+        self,
+        task_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        assignee_ids: Optional[List[int]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Fetch tasks from the backend
-        
+
         Args:
             task_id: Optional specific task ID to fetch
-            
+            project_id: Optional project ID to filter server-side
+            assignee_ids: Optional assignee IDs to filter server-side
+
         Returns:
             List of task dictionaries
         """
@@ -35,23 +229,32 @@ class DataAgent:
                 url = f"{self.backend_url}/tasks/{task_id}"
                 response = await self.client.get(url)
                 response.raise_for_status()
-                return [response.json()]
+                return [_loads(response)]
             else:
-                url = f"{self.backend_url}/tasks"
-                response = await self.client.get(url)
-                response.raise_for_status()
-                return response.json()
+                params = {}
+                if project_id is not None:
+                    params["project_id"] = project_id
+                if assignee_ids:
+                    params["assignee_ids"] = ",".join(str(a) for a in assignee_ids)
+                return await self._get_cached(f"{self.backend_url}/tasks", params=params or None)
         except Exception as e:
             logger.error(f"Error fetching tasks: {e}")
             return []
-    
-    async def fetch_users(self, user_id: Optional[int] = None) -> List[Dict[str, Any]]:
+
+    async def fetch_users(
+        self,
+        user_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        team_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Fetch users from the backend
-        
+
         Args:
             user_id: Optional specific user ID to fetch
-            
+            project_id: Optional project ID to filter server-side
+            team_id: Optional team ID to filter server-side
+
         Returns:
             List of user dictionaries
         """
@@ -60,16 +263,54 @@ class DataAgent:
                 url = f"{self.backend_url}/users/{user_id}"
                 response = await self.client.get(url)
                 response.raise_for_status()
-                return [response.json()]
+                return [_loads(response)]
             else:
-                url = f"{self.backend_url}/users"
-                response = await self.client.get(url)
-                response.raise_for_status()
-                return response.json()
+                params = {}
+                if project_id is not None:
+                    params["project_id"] = project_id
+                if team_id is not None:
+                    params["team_id"] = team_id
+                return await self._get_cached(f"{self.backend_url}/users", params=params or None)
         except Exception as e:
             logger.error(f"Error fetching users: {e}")
             return []
     
+    async def stream_tasks(self):
+        """Stream tasks from the backend, yielding each task as it is parsed
+
+        For very large /tasks payloads this lets aggregation start while the
+        body is still downloading and never materializes the full decoded
+        list. The buffered fetch_tasks path stays the default for the
+        team-sized payloads this deployment normally sees.
+        """
+        url = f"{self.backend_url}/tasks"
+        async with self.client.stream("GET", url, headers={"Accept": "application/json"}) as response:
+            response.raise_for_status()
+            async for task in ijson.items(response.aiter_bytes(), "item"):
+                yield task
+
+    async def _fetch_tasks_typed(self) -> List[TaskRecord]:
+        """Fetch all tasks decoded directly into TaskRecord structs"""
+        try:
+            return await self._get_cached(f"{self.backend_url}/tasks", decoders=_task_list_decoders)
+        except Exception as e:
+            logger.error(f"Error fetching tasks: {e}")
+            return []
+
+    async def _fetch_users_typed(self, project_id: Optional[int] = None) -> List[UserRecord]:
+        """Fetch users decoded directly into UserRecord structs
+
+        Passes project_id as a query param so the backend can filter
+        server-side and only the relevant rows cross the wire.
+        """
+        try:
+            params = {"project_id": project_id} if project_id is not None else None
+            return await self._get_cached(f"{self.backend_url}/users",
+                                          decoders=_user_list_decoders, params=params)
+        except Exception as e:
+            logger.error(f"Error fetching users: {e}")
+            return []
+
     async def fetch_teams(self, team_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetch teams from the backend
@@ -85,12 +326,9 @@ class DataAgent:
                 url = f"{self.backend_url}/teams/{team_id}"
                 response = await self.client.get(url)
                 response.raise_for_status()
-                return [response.json()]
+                return [_loads(response)]
             else:
-                url = f"{self.backend_url}/teams"
-                response = await self.client.get(url)
-                response.raise_for_status()
-                return response.json()
+                return await self._get_cached(f"{self.backend_url}/teams", ttl=self.slow_cache_ttl)
         except Exception as e:
             logger.error(f"Error fetching teams: {e}")
             return []
@@ -110,12 +348,9 @@ class DataAgent:
                 url = f"{self.backend_url}/projects/{project_id}"
                 response = await self.client.get(url)
                 response.raise_for_status()
-                return [response.json()]
+                return [_loads(response)]
             else:
-                url = f"{self.backend_url}/projects"
-                response = await self.client.get(url)
-                response.raise_for_status()
-                return response.json()
+                return await self._get_cached(f"{self.backend_url}/projects", ttl=self.slow_cache_ttl)
         except Exception as e:
             logger.error(f"Error fetching projects: {e}")
             return []
@@ -154,22 +389,26 @@ class DataAgent:
             logger.error(f"Error fetching team {team_id}: {e}")
             return {}
     
-    async def fetch_user_workload(self, user_id: int) -> int:
+    async def fetch_user_workload(self, user_id: int, tasks: Optional[List[Dict[str, Any]]] = None) -> int:
         """
         Calculate user workload based on assigned tasks
-        
+
         Args:
             user_id: User ID
-            
+            tasks: Optional preloaded task list; fetched from the backend if omitted
+
         Returns:
             Total story points assigned to user
         """
         try:
-            tasks = await self.fetch_tasks()
-            user_tasks = [t for t in tasks if t.get('assignee_id') == user_id 
-                         and t.get('status') != 'COMPLETED']
-            
-            workload = sum(t.get('story_points', 0) for t in user_tasks)
+            if tasks is None:
+                tasks = await self.fetch_tasks()
+            # Single pass: probe assignee_id/status once per task instead of
+            # building an intermediate filtered list and walking it again
+            workload = 0
+            for t in tasks:
+                if t.get('assignee_id') == user_id and t.get('status') != 'COMPLETED':
+                    workload += t.get('story_points', 0)
             return workload
         except Exception as e:
             logger.error(f"Error calculating user workload: {e}")
@@ -224,63 +463,77 @@ class DataAgent:
             List of preprocessed user dictionaries
         """
         try:
-            users = await self.fetch_users()
-            
-            # Filter by project if specified
+            # Users and tasks are independent round-trips; fetch them concurrently,
+            # decoded straight into typed structs (attribute access beats dict
+            # probing in the aggregation loops below)
+            users, all_tasks = await asyncio.gather(
+                self._fetch_users_typed(project_id=project_id),
+                self._fetch_tasks_typed()
+            )
+
+            # Filter by project if specified (kept as a cheap safety net in
+            # case the backend ignores the query param)
             if project_id:
-                users = [u for u in users if u.get('project_id') == project_id]
-            
-            # Calculate workload and other feature metrics for each user
-            # Fetch all tasks once to compute per-user aggregates
-            all_tasks = await self.fetch_tasks()
+                users = [u for u in users if u.project_id == project_id]
+
+            # Index tasks by assignee and parse each creation timestamp exactly
+            # once, so the per-user aggregates below are O(1) lookups with no
+            # repeated ISO parsing
+            tasks_by_assignee = defaultdict(list)
+            for t in all_tasks:
+                t.created_dt = _safe_fromiso(t.created_at or t.created)
+                tasks_by_assignee[t.assignee_id].append(t)
+
+            cutoff = datetime.utcnow() - timedelta(days=14)
 
             processed_users = []
             for user in users:
-                user_id = user.get('id')
-                # Active tasks assigned (not COMPLETED)
-                user_tasks = [t for t in all_tasks if t.get('assignee_id') == user_id and t.get('status') != 'COMPLETED']
-                completed_tasks = [t for t in all_tasks if t.get('assignee_id') == user_id and t.get('status') == 'COMPLETED']
-
-                current_workload_count = len(user_tasks)
-                # avg complexity: prefer explicit 'complexity' then 'story_points'
-                complexities = [t.get('complexity', t.get('story_points', 5)) for t in user_tasks]
-                avg_task_complexity = sum(complexities) / len(complexities) if complexities else 0.0
+                user_id = user.id
+                assigned_tasks = tasks_by_assignee.get(user_id, [])
 
-                # recent assignments in last N days (use created_at if available)
+                # Single pass over this user's tasks: active/completed counts,
+                # story points, avg complexity and recency all in one walk
+                current_workload_count = 0
+                completed_count = 0
+                workload_story_points = 0.0
+                complexity_sum = 0.0
                 recent_count = 0
-                from datetime import datetime, timedelta
-                cutoff = datetime.utcnow() - timedelta(days=14)
-                for t in all_tasks:
-                    if t.get('assignee_id') == user_id:
-                        created = t.get('created_at') or t.get('created')
-                        if created:
-                            try:
-                                dt = datetime.fromisoformat(created)
-                                if dt >= cutoff:
-                                    recent_count += 1
-                            except Exception:
-                                pass
+                for t in assigned_tasks:
+                    if t.status == 'COMPLETED':
+                        completed_count += 1
+                    else:
+                        current_workload_count += 1
+                        workload_story_points += t.story_points or 0
+                        # avg complexity: prefer explicit 'complexity' then 'story_points'
+                        complexity_sum += (t.complexity if t.complexity is not None
+                                           else (t.story_points if t.story_points is not None else 5))
+                    # recent assignments in last N days (use created_at if available)
+                    if t.created_dt is not None and t.created_dt >= cutoff:
+                        recent_count += 1
+
+                avg_task_complexity = complexity_sum / current_workload_count if current_workload_count else 0.0
 
                 # completion confidence: completed / total assigned (fallback 0.8)
-                total_assigned = len([t for t in all_tasks if t.get('assignee_id') == user_id])
-                completion_confidence = (len(completed_tasks) / total_assigned) if total_assigned > 0 else 0.8
+                total_assigned = len(assigned_tasks)
+                completion_confidence = (completed_count / total_assigned) if total_assigned > 0 else 0.8
 
                 processed_user = {
                     "id": str(user_id),
-                    "name": user.get('name'),
-                    "email": user.get('email'),
-                    "role": user.get('role'),
-                    "team_id": str(user.get('team_id')) if user.get('team_id') else None,
-                    "project_id": str(user.get('project_id')) if user.get('project_id') else None,
-                    "skills": user.get('skills', []),  # CRITICAL: Include skills for skill matching
+                    "name": user.name,
+                    "email": user.email,
+                    "role": user.role,
+                    "team_id": str(user.team_id) if user.team_id else None,
+                    "project_id": str(user.project_id) if user.project_id else None,
+                    "skills": user.skills,  # CRITICAL: Include skills for skill matching
+                    "_skill_mask": _skill_mask(user.skills),  # cached for skill matching
                     "current_workload": current_workload_count,
-                    "workload_story_points": await self.fetch_user_workload(user_id),
-                    "availability": user.get('availability', True),
-                    "joining_date": str(user.get('joining_date')) if user.get('joining_date') else None,
-                    "experience_years": float(user.get('experience_years', 0)),
+                    "workload_story_points": workload_story_points,
+                    "availability": user.availability,
+                    "joining_date": str(user.joining_date) if user.joining_date else None,
+                    "experience_years": float(user.experience_years or 0),
                     "recent_assignments_count": recent_count,
                     "avg_task_complexity": float(avg_task_complexity),
-                    "completed_tasks_count": len(completed_tasks),
+                    "completed_tasks_count": completed_count,
                     "total_assigned_count": total_assigned,
                     "estimated_completion_confidence": float(completion_confidence),
                 }
@@ -319,6 +572,28 @@ class DataAgent:
             raise
     
     async def collect_decision_context(self, task_id: int) -> Dict[str, Any]:
+        """Collect decision context for a task through a short TTL cache
+
+        Repeated calls for the same task_id within context_ttl seconds (retry
+        bursts, duplicate UI submissions) return the cached context, and a
+        per-task lock deduplicates concurrent in-flight builds so a burst
+        triggers exactly one round of backend fetches.
+        """
+        hit = self._ctx_cache.get(task_id)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+        lock = self._ctx_locks.setdefault(task_id, asyncio.Lock())
+        async with lock:
+            # Re-check: a concurrent caller may have filled the cache while
+            # this one waited on the lock
+            hit = self._ctx_cache.get(task_id)
+            if hit is not None and hit[0] > time.monotonic():
+                return hit[1]
+            context = await self._collect_decision_context(task_id)
+            self._ctx_cache[task_id] = (time.monotonic() + self.context_ttl, context)
+            return context
+
+    async def _collect_decision_context(self, task_id: int) -> Dict[str, Any]:
         """
         Collect all relevant context for making a decision about a task
         
@@ -335,101 +610,122 @@ class DataAgent:
             team_id = task.get('team_id')
             project_id = task.get('project_id')
             
-            # Filter by team if available, otherwise filter by project
+            # Users, tasks and teams are independent fetches once the task is known;
+            # run them concurrently so latency is max() of the round-trips, not sum()
+            users, all_tasks, teams = await asyncio.gather(
+                self.preprocess_user_data(project_id),
+                self.fetch_tasks(),
+                self.preprocess_team_data()
+            )
+
+            # Filter by team if available, otherwise fall back to project filtering
             if team_id:
                 # Filter users by team_id (convert to string since preprocess_user_data returns strings)
-                all_project_users = await self.preprocess_user_data(project_id)
                 team_id_str = str(team_id)
-                users = [u for u in all_project_users if u.get('team_id') == team_id_str]
-            else:
-                # Fall back to project filtering
-                users = await self.preprocess_user_data(project_id)
-
-            # Build candidate features by combining task requirements and user metrics
-            # Fetch all tasks to compute skill match and other dynamic fields
-            all_tasks = await self.fetch_tasks()
+                users = [u for u in users if u.get('team_id') == team_id_str]
 
             required_skills = task.get('required_skills') or []
+            # intern to a bitmask once; constant across all candidates
+            task_mask = _skill_mask(required_skills)
+
+            # policy threshold and deadline urgency are task-level constants;
+            # compute them once instead of per candidate
+            max_workload = settings.max_allowed_workload
+            deadline_urgency = 0.0
+            due = _safe_fromiso(task.get('deadline'))
+            if due is not None:
+                delta = (due - datetime.utcnow()).total_seconds()
+                # map to 0-1 where 0 = plenty of time, 1 = urgent (<=0)
+                deadline_urgency = max(0.0, min(1.0, 1.0 - (delta / (7 * 24 * 3600))))
+            deadline_urgency = round(float(deadline_urgency), 3)
+
             candidates = []
             for u in users:
-                # compute skill match score (Jaccard over skill names)
+                # compute skill match score (Jaccard over interned skill
+                # bitmasks cached during preprocessing)
                 user_skills = u.get('skills') or []
-                # normalize to lowercase
-                set_req = set([s.lower() for s in required_skills]) if required_skills else set()
-                set_usr = set([s.lower() for s in user_skills]) if user_skills else set()
-                
-                # DEBUG: Log skill matching for first user
-                if u.get('id') == '202':  # Emily Rodriguez
-                    logger.debug(f"DEBUG SKILL MATCH - User {u.get('name')} (ID: {u.get('id')})")
-                    logger.debug(f"  Required skills: {required_skills}")
-                    logger.debug(f"  User skills: {user_skills}")
-                    logger.debug(f"  Set required: {set_req}")
-                    logger.debug(f"  Set user: {set_usr}")
-                    logger.debug(f"  Intersection: {set_req.intersection(set_usr) if set_req else 'N/A'}")
-                    logger.debug(f"  Union: {set_req.union(set_usr) if set_req else 'N/A'}")
-                
-                if set_req:
-                    intersection = set_req.intersection(set_usr)
-                    union = set_req.union(set_usr)
-                    skill_match = len(intersection) / len(union) if union else 0.0
+                user_mask = u.get('_skill_mask')
+                if user_mask is None:
+                    user_mask = _skill_mask(user_skills)
+
+                # DEBUG: Log skill matching (lazy %-formatting; skipped entirely
+                # unless debug logging is actually enabled)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("SKILL MATCH - User %s (ID: %s)", u.get('name'), u.get('id'))
+                    logger.debug("  Required skills: %s | User skills: %s", required_skills, user_skills)
+
+                if task_mask:
+                    # Jaccard via popcount: |A∩B| / |A∪B|
+                    skill_match = (task_mask & user_mask).bit_count() / (task_mask | user_mask).bit_count()
                 else:
                     # if no explicit required skills, use 0.5 neutral
                     skill_match = 0.5
 
                 # fairness adjustment: inverse of recent_assignments_count (normalize)
-                recent = u.get('recent_assignments_count', 0)
+                recent = u['recent_assignments_count']
                 fairness = 1.0 / (1 + recent)
 
                 # wellbeing flag: overloaded if current_workload exceeds policy
-                from config.settings import settings as cfg
-                wellbeing_flag = True if u.get('current_workload', 0) >= cfg.max_allowed_workload else False
-
-                # deadline urgency
-                deadline_urgency = 0.0
-                import datetime
-                if task.get('deadline'):
-                    try:
-                        due = datetime.datetime.fromisoformat(task['deadline'])
-                        now = datetime.datetime.utcnow()
-                        delta = (due - now).total_seconds()
-                        # map to 0-1 where 0 = plenty of time, 1 = urgent (<=0)
-                        deadline_urgency = max(0.0, min(1.0, 1.0 - (delta / (7 * 24 * 3600))))
-                    except Exception:
-                        deadline_urgency = 0.0
-
-                candidate = {
-                    "id": u.get('id'),
-                    "name": u.get('name'),
-                    "availability": u.get('availability', True),
-                    "current_workload": u.get('current_workload', 0),
-                    "workload_story_points": u.get('workload_story_points', 0),
-                    "experience_years": u.get('experience_years', 0),
-                    "recent_assignments_count": u.get('recent_assignments_count', 0),
-                    "avg_task_complexity": u.get('avg_task_complexity', 0.0),
-                    "skill_match_score": round(float(skill_match), 3),
-                    "estimated_completion_confidence": round(float(u.get('estimated_completion_confidence', 0.8)), 3),
-                    "fairness_adjustment_score": round(float(fairness), 3),
-                    "wellbeing_flag": wellbeing_flag,
-                    "role": u.get('role'),
-                    "deadline_urgency": round(float(deadline_urgency), 3)
-                }
+                current_workload = u['current_workload']
+
+                # processed users always carry every feature key, so plain
+                # indexing (no per-field default probing) is enough here
+                candidate = Candidate(
+                    # normalized to int once here so downstream lookups and
+                    # the response path never re-cast per access
+                    id=int(u['id']),
+                    name=u['name'],
+                    availability=u['availability'],
+                    current_workload=current_workload,
+                    workload_story_points=u['workload_story_points'],
+                    experience_years=u['experience_years'],
+                    recent_assignments_count=recent,
+                    avg_task_complexity=u['avg_task_complexity'],
+                    skill_match_score=round(skill_match, 3),
+                    estimated_completion_confidence=round(u['estimated_completion_confidence'], 3),
+                    fairness_adjustment_score=round(fairness, 3),
+                    wellbeing_flag=current_workload >= max_workload,
+                    role=u['role'],
+                    deadline_urgency=deadline_urgency
+                )
 
                 candidates.append(candidate)
 
-            teams = await self.preprocess_team_data()
+            # Parallel feature tuples (struct-of-arrays) so deterministic
+            # scoring can walk contiguous per-field sequences instead of
+            # touching every candidate record per field
+            features = {
+                "ids": tuple(c.id for c in candidates),
+                "skill": tuple(c.skill_match_score for c in candidates),
+                "exp": tuple(c.experience_years for c in candidates),
+                "conf": tuple(c.estimated_completion_confidence for c in candidates),
+                "workload": tuple(c.current_workload for c in candidates),
+                "fairness": tuple(c.fairness_adjustment_score for c in candidates),
+                "deadline": tuple(c.deadline_urgency for c in candidates),
+            }
 
             context = {
                 "task": task,
                 "candidates": candidates,
+                "features": features,
                 "teams": teams,
                 "raw_users": users
             }
-            
+
             return context
         except Exception as e:
             logger.error(f"Error collecting decision context: {e}")
             raise
 
 
-# Create a singleton instance
-data_agent = DataAgent()
+# Lazily-created singleton; avoids constructing the agent (and touching
+# settings/HTTP machinery) at import time
+_agent: Optional[DataAgent] = None
+
+
+def get_data_agent() -> DataAgent:
+    """Return the process-wide DataAgent, creating it on first use"""
+    global _agent
+    if _agent is None:
+        _agent = DataAgent()
+    return _agent
@@ -2,7 +2,21 @@
 Configuration settings for the AI backend
 """
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import NamedTuple, Optional
+
+
+class AssignmentWeights(NamedTuple):
+    """Frozen task-assignment scoring weights
+
+    Immutable and accessed by attribute, so hot scoring loops do a C-level
+    slot read instead of hashing dict keys on every lookup.
+    """
+    skill_match: float = 0.35
+    experience: float = 0.25
+    completion_confidence: float = 0.2
+    workload: float = 0.1
+    fairness: float = 0.1
+    deadline_penalty: float = 0.15
 
 
 class Settings(BaseSettings):
@@ -20,8 +34,22 @@ class Settings(BaseSettings):
     # Server Configuration
     fastapi_host: str = "0.0.0.0"
     fastapi_port: int = 8000
+    # Logging level (set LOG_LEVEL=INFO in production to skip debug dumps)
+    log_level: str = "DEBUG"
     # LLM timeout (seconds) for API calls
     llm_timeout: float = 180.0
+    # Review/risk LLM timeouts (seconds): kept just above median latency and
+    # paired with retries so slow-tail calls are cancelled and retried rather
+    # than holding the handler for the full llm_timeout window
+    llm_timeout_review: float = 20.0
+    llm_timeout_risk: float = 30.0
+    llm_retries: int = 2
+    # Demo mode pins the risk-assessment reference date to the seeded
+    # dataset's timeline instead of the real clock
+    demo_mode: bool = True
+    # Per-request SLA (seconds): work still queued past this is dropped with
+    # a 503 instead of burning an LLM call the caller has given up on
+    request_sla: float = 60.0
     # LLM provider: 'groq' (default)
     llm_provider: str = "groq"
 
@@ -29,14 +57,7 @@ class Settings(BaseSettings):
     groq_api_key: Optional[str] = None
     groq_api_url: Optional[str] = "https://api.groq.com/openai/v1/chat/completions"
     # Assignment scoring weights and policy
-    assignment_weights: dict = {
-        "skill_match": 0.35,
-        "experience": 0.25,
-        "completion_confidence": 0.2,
-        "workload": 0.1,
-        "fairness": 0.1,
-        "deadline_penalty": 0.15
-    }
+    assignment_weights: AssignmentWeights = AssignmentWeights()
     # Policy thresholds
     max_allowed_workload: int = 4
     prefer_experience_when_difficulty_gt: int = 6
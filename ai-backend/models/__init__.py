@@ -1,5 +1,5 @@
-from .schemas import (
-    TaskAssignmentRequest,
+from .requests import TaskAssignmentRequest
+from .responses import (
     DecisionResponse,
     HealthResponse,
     ErrorResponse
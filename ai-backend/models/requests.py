@@ -0,0 +1,46 @@
+"""
+Request DTOs for the API
+
+These are msgspec Structs: they sit on the hot ingress path and are small
+and flat, so the single-pass JSON-to-typed-struct decode (no intermediate
+dict, validation in C) beats a Pydantic model walk. Keeping them in their
+own module also means importers that only decode requests don't pay for
+building the Pydantic response models in `responses.py`.
+"""
+import msgspec
+from typing import Optional, List
+
+
+class TaskAssignmentRequest(msgspec.Struct, kw_only=True):
+    """Request model for task assignment decision"""
+    task_id: int
+
+
+# ===== Use Case 2: Conflict Resolution =====
+
+class ConflictResolutionRequest(msgspec.Struct, kw_only=True):
+    """Request model for conflict resolution"""
+    conflict_type: str
+    project_id: int
+    task_ids: List[int]
+    business_priorities: List[str]
+    deadline_pressure: Optional[str] = "medium"
+    quality_concerns: List[str] = msgspec.field(default_factory=list)
+
+
+# ===== Use Case 3: Performance Evaluation =====
+
+class PerformanceReviewRequest(msgspec.Struct, kw_only=True):
+    """Request model for performance review"""
+    review_period: str
+    user_id: Optional[int] = None
+    team_id: Optional[int] = None
+    include_peer_feedback: Optional[bool] = True
+
+
+# ===== Use Case 4: Risk Assessment & Conflict Analysis =====
+
+class RiskAssessmentRequest(msgspec.Struct, kw_only=True):
+    """Request model for risk assessment and conflict analysis"""
+    project_id: int
+    team_id: Optional[int] = None
@@ -0,0 +1,290 @@
+"""
+Response models for the API
+
+Pydantic models: handlers return plain dicts through ORJSONResponse, so
+these exist for the OpenAPI schema on the route decorators. Each
+`BaseModel` subclass pays a pydantic-core schema build at import, which is
+why they live apart from the msgspec request DTOs in `requests.py`.
+"""
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+
+
+class EthicalAnalysis(BaseModel):
+    """Ethical checks attached to a task-assignment decision
+
+    Mirrors the prompt's ethical_checks output object, which is what the
+    handler forwards in the response.
+    """
+    wellbeing_risks: List[str] = Field(default_factory=list)
+    bias_checks: List[str] = Field(default_factory=list)
+
+
+class RiskFactor(BaseModel):
+    """Single factor inside a task-assignment risk assessment"""
+    factor: str
+    level: str
+    mitigation: Optional[str] = None
+
+
+class RiskAssessment(BaseModel):
+    """Risk agent output attached to a task-assignment decision"""
+    overall_risk_level: str = "unknown"
+    risk_factors: List[RiskFactor] = Field(default_factory=list)
+    recommendation: Optional[str] = None
+    reasoning: Optional[str] = None
+
+
+class DecisionResponse(BaseModel):
+    """Response model for AI decision"""
+    task_id: str
+    task_title: str
+    assigned_user_id: str
+    assigned_user_name: Optional[str] = None
+    confidence: float
+    explanation: str
+    detailed_reasoning: Optional[str] = None  # New field for comprehensive explanation
+    ethical_analysis: EthicalAnalysis
+    risk_assessment: RiskAssessment
+    performance_metrics: Dict[str, Any]  # Shape varies with the performance agent's output
+    reasoning_trace: List[str]
+    reassignment_suggestions: List[Dict[str, Any]] = Field(default_factory=list)
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "task_id": "1",
+                "task_title": "Fix login page bug",
+                "assigned_user_id": "5",
+                "assigned_user_name": "Alice",
+                "confidence": 0.85,
+                "explanation": "Task assigned to Alice based on...",
+                "ethical_analysis": {
+                    "wellbeing_risks": ["None"],
+                    "bias_checks": ["Decision based on objective metrics"]
+                },
+                "risk_assessment": {
+                    "overall_risk_level": "low"
+                },
+                "performance_metrics": {
+                    "performance_impact": "positive"
+                },
+                "reasoning_trace": ["Step 1...", "Step 2..."],
+                "timestamp": "2025-12-20T10:30:00"
+            }
+        }
+    )
+
+
+class HealthResponse(BaseModel):
+    """Health check response"""
+    status: str
+    version: str
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ErrorResponse(BaseModel):
+    """Error response model"""
+    error: str
+    detail: Optional[str] = None
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
+# ===== Use Case 2: Conflict Resolution =====
+
+class ConflictResolutionResponse(BaseModel):
+    """Response model for conflict resolution"""
+    conflict_type: str
+    decision: str
+    timeline_adjustment: str
+    scope_adjustment: str
+    executive_summary: str
+    detailed_reasoning: str
+    ethical_justification: str
+    action_items: List[Dict[str, str]]
+    stakeholder_messaging: Dict[str, str]
+    trade_offs: Dict[str, Any]
+    success_metrics: List[str]
+    contingency_plan: str
+    reasoning_trace: List[str]
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "conflict_type": "speed_vs_quality",
+                "decision": "balanced_approach",
+                "timeline_adjustment": "extend_by_1_day",
+                "scope_adjustment": "none",
+                "executive_summary": "Extended deadline by 1 day to maintain quality standards while minimizing delay.",
+                "detailed_reasoning": "After analyzing stakeholder perspectives...",
+                "ethical_justification": "Prioritized quality and team well-being over schedule adherence.",
+                "action_items": [{"action": "Update testing schedule", "owner": "QA Team", "timeline": "Tomorrow"}],
+                "stakeholder_messaging": {"team": "Communicated 1-day extension...", "business": "Explained quality rationale..."},
+                "trade_offs": {"speed": -1, "quality": 2, "team_wellbeing": 2},
+                "success_metrics": ["Quality maintained", "No burnout incidents"],
+                "contingency_plan": "If further delays, reduce scope of feature X",
+                "reasoning_trace": ["Step 1...", "Step 2..."],
+                "timestamp": "2025-12-20T10:30:00"
+            }
+        }
+
+
+# ===== Use Case 3: Performance Evaluation =====
+
+class PerformanceReviewResponse(BaseModel):
+    """Response model for performance review"""
+    user_id: str
+    user_name: str
+    review_period: str
+    rating: float  # Overall rating out of 5.0
+    summary: str  # Brief summary of performance
+    recommendation: str
+    justification: str
+    metrics: Dict[str, Any]
+    strengths: List[str]
+    areas_for_improvement: List[str]
+    growth_opportunities: List[str]
+    recognition_suggested: bool
+    fairness_check: str
+    ethical_considerations: str
+    comparison_to_peers: Optional[Dict[str, Any]] = None
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "user_id": "5",
+                "user_name": "Priya",
+                "review_period": "monthly",
+                "recommendation": "recognition",
+                "justification": "Consistent high performance, mentoring peers, and task completion rate 20% above average.",
+                "metrics": {
+                    "task_completion_rate": 0.95,
+                    "avg_complexity": 7.8,
+                    "peer_mentoring": 5,
+                    "teamwork_score": 0.92
+                },
+                "strengths": ["High quality work", "Peer mentoring", "Consistent delivery"],
+                "areas_for_improvement": ["Documentation", "Meeting attendance"],
+                "growth_opportunities": ["Lead a project", "Technical workshops"],
+                "recognition_suggested": True,
+                "fairness_check": "Anti-bias filters applied",
+                "ethical_considerations": "Evaluated objectively using quantitative metrics",
+                "comparison_to_peers": {"percentile": 85},
+                "timestamp": "2025-12-20T10:30:00"
+            }
+        }
+
+
+# ===== Use Case 5: Decision Audit =====
+
+class DecisionLogResponse(BaseModel):
+    """Response model for decision log entry"""
+    decision_id: str
+    decision_type: str
+    timestamp: str
+    summary: str
+    details: Dict[str, Any]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "decision_id": "DEC-20251220103000-1",
+                "decision_type": "task_assignment",
+                "timestamp": "2025-12-20T10:30:00",
+                "summary": "Assigned task 'Fix login bug' to Alice",
+                "details": {"task_id": "1", "assigned_user_id": "5"}
+            }
+        }
+
+
+# ===== Use Case 4: Risk Assessment & Conflict Analysis =====
+
+class CriticalRisk(BaseModel):
+    """One critical risk identified in a project risk assessment"""
+    type: str
+    severity: str
+    description: str
+    impact: Optional[str] = None
+
+
+class ConflictDetected(BaseModel):
+    """One conflict surfaced in a project risk assessment"""
+    type: str
+    severity: Optional[str] = None
+    description: Optional[str] = None
+    tasks: List[int] = Field(default_factory=list)
+
+
+class BlockedTask(BaseModel):
+    """Task blocked by unfinished dependencies"""
+    task_id: int
+    title: str
+    blocked_by: List[int] = Field(default_factory=list)
+
+
+class OverloadedMember(BaseModel):
+    """Team member whose workload exceeds the overload threshold"""
+    user_id: int
+    name: str
+    workload: int
+
+
+class DeadlineRisk(BaseModel):
+    """Task whose deadline falls within the risk window"""
+    task_id: int
+    title: str
+    days_remaining: int
+    progress: int = 0
+    status: Optional[str] = None
+
+
+class RecommendedAction(BaseModel):
+    """Actionable recommendation from the risk assessment"""
+    action: str
+    priority: str
+    owner: Optional[str] = None
+    timeline: Optional[str] = None
+
+
+class RiskAssessmentResponse(BaseModel):
+    """Response model for risk assessment and conflict analysis"""
+    project_id: int
+    overall_risk_level: str  # LOW, MEDIUM, HIGH, CRITICAL
+    risk_score: float  # 0.0 to 1.0
+    executive_summary: str
+    detailed_analysis: str
+    critical_risks: List[CriticalRisk]
+    conflicts_detected: List[ConflictDetected]
+    blocked_tasks: List[BlockedTask]
+    overloaded_members: List[OverloadedMember]
+    deadline_risks: List[DeadlineRisk]
+    mitigation_strategies: List[str]
+    recommended_actions: List[RecommendedAction]
+    stakeholder_message: str
+    confidence_score: float
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "project_id": 1,
+                "overall_risk_level": "HIGH",
+                "risk_score": 0.75,
+                "executive_summary": "Project faces high deadline risk with 3 critical blocked tasks",
+                "detailed_analysis": "Detailed analysis...",
+                "critical_risks": [{"type": "deadline", "severity": "high", "description": "..."}],
+                "conflicts_detected": [{"type": "speed_vs_quality", "tasks": [1, 2]}],
+                "blocked_tasks": [{"task_id": 10, "blocked_by": [1], "impact": "high"}],
+                "overloaded_members": [{"user_id": 201, "workload": 13, "threshold": 10}],
+                "deadline_risks": [{"task_id": 1, "days_remaining": 2, "completion": 60}],
+                "mitigation_strategies": ["Extend deadline by 2 days", "Reassign tasks"],
+                "recommended_actions": [{"action": "Extend deadline", "priority": "high"}],
+                "stakeholder_message": "Communicate timeline adjustment...",
+                "confidence_score": 0.85,
+                "timestamp": "2026-01-03T10:30:00"
+            }
+        }
@@ -2,14 +2,139 @@
 Decision Logging Service - Implements audit trail and decision history
 Use Case 5: Transparent Decision Logging
 """
-import json
+import bisect
 import logging
+import os
+import orjson
+import threading
+from collections import defaultdict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Hot callables bound once at module scope; skips the attribute lookups on
+# every decision write
+_utcnow = datetime.utcnow
+_dumps = orjson.dumps
+_loads = orjson.loads
+
+
+
+# Summary templates are rendered with str.format_map over a pre-flattened
+# view dict instead of rebuilding large f-strings per call
+_NL = "\n"
+
+# Appends are buffered and written in batches: one os.write covers up to
+# this many lines (the app's background flusher drains sooner when idle)
+_PENDING_FLUSH_MAX = 64
+
+_TASK_SUMMARY_TMPL = """
+=== DECISION LOG ===
+Decision ID: {decision_id}
+Type: Task Assignment
+Timestamp: {timestamp}
+Created By: {created_by}
+
+DECISION:
+Task: {task_title} (ID: {task_id})
+Assigned To: {assigned_user_name} (ID: {assigned_user_id})
+Confidence: {confidence:.2f}
+
+REASONING:
+{explanation}
+
+ETHICAL ANALYSIS:
+Fairness Score: {fairness_score}
+Ethical Concerns: {ethical_concerns}
+
+RISK ASSESSMENT:
+Overall Risk Level: {overall_risk_level}
+
+PRIORITY FACTORS:
+{priority_factors}
+
+ACTION ITEMS:
+{action_items}
+
+===================
+"""
+
+_CONFLICT_SUMMARY_TMPL = """
+=== DECISION LOG ===
+Decision ID: {decision_id}
+Type: Conflict Resolution
+Timestamp: {timestamp}
+Created By: {created_by}
+
+CONFLICT:
+Type: {conflict_type}
+Project ID: {project_id}
+
+RESOLUTION:
+Decision: {decision}
+Timeline Adjustment: {timeline_adjustment}
+Scope Adjustment: {scope_adjustment}
+
+EXECUTIVE SUMMARY:
+{executive_summary}
+
+ETHICAL JUSTIFICATION:
+{ethical_justification}
+
+STAKEHOLDER MESSAGING:
+Team: {msg_team}
+Business: {msg_business}
+Customer: {msg_customer}
+
+===================
+"""
+
+_GENERIC_SUMMARY_TMPL = """
+=== DECISION LOG ===
+Decision ID: {decision_id}
+Type: {decision_type}
+Timestamp: {timestamp}
+Created By: {created_by}
+
+{raw}
+===================
+"""
+
+
+def _compile_log_ctor(decision_type: str, fields: tuple):
+    """Compile a dict constructor for one decision-type's log entry.
+
+    Each log_* method builds the same 10-18 key dict shape on every call.
+    Compiling the literal once per type gives a single specialized function
+    whose constant keys are interned at compile time, so appends pay one
+    BUILD_MAP instead of assembling the shape inside the larger method.
+    """
+    args = ", ".join(("decision_id", "timestamp") + fields)
+    items = ["'decision_id': decision_id",
+             f"'decision_type': {decision_type!r}",
+             "'timestamp': timestamp"]
+    items += [f"{name!r}: {name}" for name in fields]
+    items += ["'created_by': 'AI_System'", "'version': '1.0'"]
+    src = f"lambda {args}: {{{', '.join(items)}}}"
+    return eval(compile(src, "<decision_log_ctor>", "eval"))
+
+
+_make_task_assignment_log = _compile_log_ctor("task_assignment", (
+    "task_id", "task_title", "assigned_user_id", "assigned_user_name",
+    "confidence", "explanation", "ethical_analysis", "risk_assessment",
+    "performance_metrics", "reasoning_trace", "priority_factors",
+    "alternative_options", "action_items"))
+
+_make_conflict_resolution_log = _compile_log_ctor("conflict_resolution", (
+    "conflict_type", "project_id", "resolution", "trade_offs",
+    "ethical_justification", "reasoning_trace"))
+
+_make_performance_review_log = _compile_log_ctor("performance_review", (
+    "user_id", "user_name", "review_period", "recommendation",
+    "justification", "metrics", "fairness_check", "ethical_considerations"))
+
 
 class DecisionLogger:
     """
@@ -22,28 +147,169 @@ class DecisionLogger:
     def __init__(self, log_directory: str = "decision_logs"):
         self.log_directory = Path(log_directory)
         self.log_directory.mkdir(exist_ok=True)
-        self.current_log_file = self.log_directory / f"decisions_{datetime.now().strftime('%Y%m')}.json"
+        self.current_log_file = self._log_file_for(_utcnow())
+        self._ensure_log_file()
+        # Persistent append descriptor: one os.write per decision instead of
+        # an open/close pair and file-object allocation per append. O_APPEND
+        # writes are atomic, so durability only needs the explicit fsync in
+        # flush() (called on shutdown).
+        self._fd = self._open_fd()
+        # Serialized lines not yet written; batched into single os.write
+        # calls so logging stays off the per-decision syscall path
+        self._pending: List[bytes] = []
+        self._pending_lock = threading.Lock()
+        # In-memory view of the month's log, loaded once and kept in sync
+        # with appends; queries never re-parse the file. An mtime check
+        # reloads if another process wrote the file.
+        self._logs = self._read_logs()
+        self._logs_mtime = self._stat_mtime()
+        # Secondary indices so the by-id/task/user/type getters are O(1)/O(k)
+        # dict lookups instead of full scans; maintained at append time
+        self._rebuild_indices()
+        # Monotonic sequence for decision IDs; guarded so concurrent log
+        # calls from worker threads never mint the same ID
+        self._counter = len(self._logs)
+        self._id_lock = threading.Lock()
+    
+    def _log_file_for(self, now: datetime) -> Path:
+        return self.log_directory / f"decisions_{now.strftime('%Y%m')}.jsonl"
+    
+    def _next_decision_id(self, now: datetime) -> str:
+        with self._id_lock:
+            self._counter += 1
+            seq = self._counter
+        return f"DEC-{now.strftime('%Y%m%d%H%M%S')}-{seq}"
+    
+    def _rollover_if_needed(self, now: datetime):
+        """Start a fresh file and state when the month changes mid-process"""
+        expected = self._log_file_for(now)
+        if expected == self.current_log_file:
+            return
+        self.flush_pending()
+        self.current_log_file = expected
         self._ensure_log_file()
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+        self._fd = self._open_fd()
+        self._logs = self._read_logs()
+        self._logs_mtime = self._stat_mtime()
+        self._rebuild_indices()
+        with self._id_lock:
+            self._counter = len(self._logs)
     
+    def _open_fd(self) -> int:
+        return os.open(str(self.current_log_file),
+                       os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def flush_pending(self):
+        """Write all buffered log lines with a single os.write"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            os.write(self._fd, b"".join(pending))
+            self._logs_mtime = self._stat_mtime()
+        except OSError as e:
+            logger.error(f"Error writing log batch: {e}")
+
+    def flush(self):
+        """Force the appended decisions to disk (wired to app shutdown)"""
+        self.flush_pending()
+        try:
+            os.fsync(self._fd)
+        except OSError as e:
+            logger.error(f"Error syncing log file: {e}")
+
     def _ensure_log_file(self):
-        """Ensure the log file exists"""
-        if not self.current_log_file.exists():
-            self.current_log_file.write_text("[]")
+        """Ensure the log file exists, migrating a legacy JSON-array file"""
+        if self.current_log_file.exists():
+            return
+        legacy = self.current_log_file.with_suffix(".json")
+        if legacy.exists():
+            try:
+                entries = _loads(legacy.read_bytes())
+                with self.current_log_file.open("wb") as f:
+                    for entry in entries:
+                        f.write(_dumps(entry, default=str) + b"\n")
+                logger.info(f"Migrated {len(entries)} legacy log entries to {self.current_log_file.name}")
+                return
+            except Exception as e:
+                logger.error(f"Error migrating legacy log file: {e}")
+        self.current_log_file.touch()
+    
+    def _stat_mtime(self) -> float:
+        try:
+            return self.current_log_file.stat().st_mtime
+        except OSError:
+            return 0.0
+    
+    def _maybe_reload(self):
+        """Reload the in-memory log if the file changed underneath us"""
+        self.flush_pending()
+        mtime = self._stat_mtime()
+        if mtime != self._logs_mtime:
+            self._logs = self._read_logs()
+            self._logs_mtime = mtime
+            self._rebuild_indices()
+            with self._id_lock:
+                self._counter = max(self._counter, len(self._logs))
+    
+    def _rebuild_indices(self):
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_task: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_user: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        # Parallel sorted timestamp list: appends are time-ordered and ISO
+        # strings compare lexicographically, so date-range queries can bisect
+        self._timestamps: List[str] = []
+        for log in self._logs:
+            self._index_entry(log)
+
+    def _index_entry(self, log: Dict[str, Any]):
+        # Freshly appended entries carry a datetime (orjson renders it in C
+        # at write time); the bisect index always keys on the ISO string
+        ts = log.get("timestamp", "")
+        self._timestamps.append(ts if isinstance(ts, str) else ts.isoformat())
+        decision_id = log.get("decision_id")
+        if decision_id:
+            self._by_id[decision_id] = log
+        if log.get("task_id") is not None:
+            self._by_task[str(log["task_id"])].append(log)
+        self._by_type[log.get("decision_type", "")].append(log)
+        user_ids = {str(log[key]) for key in ("assigned_user_id", "user_id")
+                    if log.get(key) is not None}
+        for uid in user_ids:
+            self._by_user[uid].append(log)
     
     def _read_logs(self) -> List[Dict[str, Any]]:
-        """Read all logs from current month's file"""
+        """Read all logs from current month's file (one JSON object per line)"""
+        logs = []
         try:
-            return json.loads(self.current_log_file.read_text())
+            with self.current_log_file.open("rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        logs.append(_loads(line))
         except Exception as e:
             logger.error(f"Error reading logs: {e}")
-            return []
+        return logs
     
-    def _write_logs(self, logs: List[Dict[str, Any]]):
-        """Write logs to file"""
+    def _append_log(self, entry: Dict[str, Any]):
+        """Record a decision in memory and buffer its JSON line for disk"""
         try:
-            self.current_log_file.write_text(json.dumps(logs, indent=2, default=str))
+            line = _dumps(entry, default=str) + b"\n"
+            self._logs.append(entry)
+            self._index_entry(entry)
+            with self._pending_lock:
+                self._pending.append(line)
+                full = len(self._pending) >= _PENDING_FLUSH_MAX
+            if full:
+                self.flush_pending()
         except Exception as e:
-            logger.error(f"Error writing logs: {e}")
+            logger.error(f"Error writing log: {e}")
     
     def log_task_assignment_decision(
         self,
@@ -67,33 +333,19 @@ class DecisionLogger:
         Returns:
             decision_id: Unique identifier for this decision
         """
-        logs = self._read_logs()
-        
-        decision_id = f"DEC-{datetime.now().strftime('%Y%m%d%H%M%S')}-{len(logs)+1}"
+        # One clock read per decision covers rollover, the ID and the entry
+        now = _utcnow()
+        self._rollover_if_needed(now)
+        decision_id = self._next_decision_id(now)
         
-        decision_log = {
-            "decision_id": decision_id,
-            "decision_type": "task_assignment",
-            "timestamp": datetime.utcnow().isoformat(),
-            "task_id": task_id,
-            "task_title": task_title,
-            "assigned_user_id": assigned_user_id,
-            "assigned_user_name": assigned_user_name,
-            "confidence": confidence,
-            "explanation": explanation,
-            "ethical_analysis": ethical_analysis,
-            "risk_assessment": risk_assessment,
-            "performance_metrics": performance_metrics,
-            "reasoning_trace": reasoning_trace,
-            "priority_factors": priority_factors,
-            "alternative_options": alternative_options,
-            "action_items": action_items,
-            "created_by": "AI_System",
-            "version": "1.0"
-        }
+        decision_log = _make_task_assignment_log(
+            decision_id, now, task_id, task_title,
+            assigned_user_id, assigned_user_name, confidence, explanation,
+            ethical_analysis, risk_assessment, performance_metrics,
+            reasoning_trace, priority_factors, alternative_options,
+            action_items)
         
-        logs.append(decision_log)
-        self._write_logs(logs)
+        self._append_log(decision_log)
         
         logger.info(f"Logged decision: {decision_id}")
         return decision_id
@@ -113,26 +365,16 @@ class DecisionLogger:
         Returns:
             decision_id: Unique identifier for this decision
         """
-        logs = self._read_logs()
+        # One clock read per decision covers rollover, the ID and the entry
+        now = _utcnow()
+        self._rollover_if_needed(now)
+        decision_id = self._next_decision_id(now)
         
-        decision_id = f"DEC-{datetime.now().strftime('%Y%m%d%H%M%S')}-{len(logs)+1}"
+        decision_log = _make_conflict_resolution_log(
+            decision_id, now, conflict_type, project_id,
+            resolution, trade_offs, ethical_justification, reasoning_trace)
         
-        decision_log = {
-            "decision_id": decision_id,
-            "decision_type": "conflict_resolution",
-            "timestamp": datetime.utcnow().isoformat(),
-            "conflict_type": conflict_type,
-            "project_id": project_id,
-            "resolution": resolution,
-            "trade_offs": trade_offs,
-            "ethical_justification": ethical_justification,
-            "reasoning_trace": reasoning_trace,
-            "created_by": "AI_System",
-            "version": "1.0"
-        }
-        
-        logs.append(decision_log)
-        self._write_logs(logs)
+        self._append_log(decision_log)
         
         logger.info(f"Logged conflict resolution: {decision_id}")
         return decision_id
@@ -154,57 +396,84 @@ class DecisionLogger:
         Returns:
             decision_id: Unique identifier for this decision
         """
-        logs = self._read_logs()
+        # One clock read per decision covers rollover, the ID and the entry
+        now = _utcnow()
+        self._rollover_if_needed(now)
+        decision_id = self._next_decision_id(now)
+        
+        decision_log = _make_performance_review_log(
+            decision_id, now, user_id, user_name, review_period,
+            recommendation, justification, metrics, fairness_check,
+            ethical_considerations)
         
-        decision_id = f"DEC-{datetime.now().strftime('%Y%m%d%H%M%S')}-{len(logs)+1}"
+        self._append_log(decision_log)
         
+        logger.info(f"Logged performance review: {decision_id}")
+        return decision_id
+    
+    async def log_decision(
+        self,
+        decision_type: str,
+        decision_maker: str,
+        decision: str,
+        reasoning: str,
+        ethical_considerations: List[str],
+        alternatives_considered: List[Any],
+        confidence_score: float,
+        metadata: Dict[str, Any]
+    ) -> str:
+        """
+        Log a generic decision entry (async so handlers can fire-and-forget)
+
+        Returns:
+            decision_id: Unique identifier for this decision
+        """
+        # One clock read per decision covers rollover, the ID and the entry
+        now = _utcnow()
+        self._rollover_if_needed(now)
+        decision_id = self._next_decision_id(now)
+
+        # decision_type is caller-supplied here, so no precompiled
+        # constructor; the literal keeps the shared envelope fields
         decision_log = {
             "decision_id": decision_id,
-            "decision_type": "performance_review",
-            "timestamp": datetime.utcnow().isoformat(),
-            "user_id": user_id,
-            "user_name": user_name,
-            "review_period": review_period,
-            "recommendation": recommendation,
-            "justification": justification,
-            "metrics": metrics,
-            "fairness_check": fairness_check,
+            "decision_type": decision_type,
+            "timestamp": now,
+            "decision_maker": decision_maker,
+            "decision": decision,
+            "reasoning": reasoning,
             "ethical_considerations": ethical_considerations,
+            "alternatives_considered": alternatives_considered,
+            "confidence_score": confidence_score,
+            "metadata": metadata,
             "created_by": "AI_System",
             "version": "1.0"
         }
-        
-        logs.append(decision_log)
-        self._write_logs(logs)
-        
-        logger.info(f"Logged performance review: {decision_id}")
+
+        self._append_log(decision_log)
+
+        logger.info(f"Logged decision: {decision_id}")
         return decision_id
-    
+
     def get_decision_by_id(self, decision_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific decision by ID"""
-        logs = self._read_logs()
-        for log in logs:
-            if log.get("decision_id") == decision_id:
-                return log
-        return None
+        self._maybe_reload()
+        return self._by_id.get(decision_id)
     
     def get_decisions_by_task(self, task_id: str) -> List[Dict[str, Any]]:
         """Get all decisions related to a task"""
-        logs = self._read_logs()
-        return [log for log in logs if log.get("task_id") == str(task_id)]
+        self._maybe_reload()
+        return list(self._by_task.get(str(task_id), []))
     
     def get_decisions_by_user(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all decisions related to a user"""
-        logs = self._read_logs()
-        return [
-            log for log in logs 
-            if log.get("assigned_user_id") == str(user_id) or log.get("user_id") == str(user_id)
-        ]
+        self._maybe_reload()
+        return list(self._by_user.get(str(user_id), []))
     
     def get_decisions_by_type(self, decision_type: str) -> List[Dict[str, Any]]:
         """Get all decisions of a specific type"""
-        logs = self._read_logs()
-        return [log for log in logs if log.get("decision_type") == decision_type]
+        self._maybe_reload()
+        return list(self._by_type.get(decision_type, []))
     
     def get_all_decisions(
         self,
@@ -223,17 +492,21 @@ class DecisionLogger:
         Returns:
             List of decision logs
         """
-        logs = self._read_logs()
+        self._maybe_reload()
+        logs = self._logs
         
         # Filter by type if specified
         if decision_type:
-            logs = [log for log in logs if log.get("decision_type") == decision_type]
-        
-        # Sort by timestamp (most recent first)
-        logs.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        
-        # Apply pagination
-        return logs[offset:offset + limit]
+            logs = self._by_type.get(decision_type, [])
+
+        # Entries are appended with monotonically increasing timestamps, so
+        # the list (and each index) is already time-ordered; paginate from
+        # the tail instead of re-sorting on every page fetch
+        end = len(logs) - offset
+        if end <= 0:
+            return []
+        start = max(end - limit, 0)
+        return logs[start:end][::-1]
     
     def get_audit_trail(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """
@@ -246,16 +519,13 @@ class DecisionLogger:
         Returns:
             List of decision logs within the date range
         """
-        logs = self._read_logs()
-        
-        # Filter by date range
-        filtered_logs = []
-        for log in logs:
-            timestamp = log.get("timestamp", "")
-            if start_date <= timestamp <= end_date:
-                filtered_logs.append(log)
-        
-        return filtered_logs
+        self._maybe_reload()
+
+        # Timestamps are a parallel sorted list, so the range boundaries are
+        # two bisections instead of a scan over the whole month
+        lo = bisect.bisect_left(self._timestamps, start_date)
+        hi = bisect.bisect_right(self._timestamps, end_date)
+        return self._logs[lo:hi]
     
     def generate_decision_summary(self, decision_id: str) -> str:
         """
@@ -269,83 +539,56 @@ class DecisionLogger:
             return f"Decision {decision_id} not found"
         
         decision_type = decision.get("decision_type", "Unknown")
+        
         timestamp = decision.get("timestamp", "Unknown")
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        view = {
+            "decision_id": decision_id,
+            "timestamp": timestamp,
+            "created_by": decision.get("created_by", "Unknown"),
+        }
         
         if decision_type == "task_assignment":
-            summary = f"""
-=== DECISION LOG ===
-Decision ID: {decision_id}
-Type: Task Assignment
-Timestamp: {timestamp}
-Created By: {decision.get('created_by', 'Unknown')}
-
-DECISION:
-Task: {decision.get('task_title', 'Unknown')} (ID: {decision.get('task_id', 'Unknown')})
-Assigned To: {decision.get('assigned_user_name', 'Unknown')} (ID: {decision.get('assigned_user_id', 'Unknown')})
-Confidence: {decision.get('confidence', 0):.2f}
-
-REASONING:
-{decision.get('explanation', 'No explanation provided')}
-
-ETHICAL ANALYSIS:
-Fairness Score: {decision.get('ethical_analysis', {}).get('fairness_score', 'N/A')}
-Ethical Concerns: {', '.join(decision.get('ethical_analysis', {}).get('ethical_concerns', []))}
-
-RISK ASSESSMENT:
-Overall Risk Level: {decision.get('risk_assessment', {}).get('overall_risk_level', 'N/A')}
-
-PRIORITY FACTORS:
-{chr(10).join(f'- {factor}' for factor in decision.get('priority_factors', []))}
-
-ACTION ITEMS:
-{chr(10).join(f'- {item}' for item in decision.get('action_items', []))}
-
-===================
-"""
-        elif decision_type == "conflict_resolution":
+            ethical = decision.get("ethical_analysis", {})
+            risk = decision.get("risk_assessment", {})
+            view.update(
+                task_title=decision.get("task_title", "Unknown"),
+                task_id=decision.get("task_id", "Unknown"),
+                assigned_user_name=decision.get("assigned_user_name", "Unknown"),
+                assigned_user_id=decision.get("assigned_user_id", "Unknown"),
+                confidence=decision.get("confidence", 0),
+                explanation=decision.get("explanation", "No explanation provided"),
+                fairness_score=ethical.get("fairness_score", "N/A"),
+                ethical_concerns=", ".join(ethical.get("ethical_concerns", [])),
+                overall_risk_level=risk.get("overall_risk_level", "N/A"),
+                priority_factors=_NL.join(f"- {factor}" for factor in decision.get("priority_factors", [])),
+                action_items=_NL.join(f"- {item}" for item in decision.get("action_items", []))
+            )
+            return _TASK_SUMMARY_TMPL.format_map(view)
+        
+        if decision_type == "conflict_resolution":
             resolution = decision.get("resolution", {})
-            summary = f"""
-=== DECISION LOG ===
-Decision ID: {decision_id}
-Type: Conflict Resolution
-Timestamp: {timestamp}
-Created By: {decision.get('created_by', 'Unknown')}
-
-CONFLICT:
-Type: {decision.get('conflict_type', 'Unknown')}
-Project ID: {decision.get('project_id', 'Unknown')}
-
-RESOLUTION:
-Decision: {resolution.get('decision', 'Unknown')}
-Timeline Adjustment: {resolution.get('timeline_adjustment', 'None')}
-Scope Adjustment: {resolution.get('scope_adjustment', 'None')}
-
-EXECUTIVE SUMMARY:
-{resolution.get('executive_summary', 'No summary provided')}
-
-ETHICAL JUSTIFICATION:
-{decision.get('ethical_justification', 'No justification provided')}
-
-STAKEHOLDER MESSAGING:
-Team: {resolution.get('stakeholder_messaging', {}).get('team', 'N/A')}
-Business: {resolution.get('stakeholder_messaging', {}).get('business', 'N/A')}
-Customer: {resolution.get('stakeholder_messaging', {}).get('customer', 'N/A')}
-
-===================
-"""
-        else:
-            summary = f"""
-=== DECISION LOG ===
-Decision ID: {decision_id}
-Type: {decision_type}
-Timestamp: {timestamp}
-Created By: {decision.get('created_by', 'Unknown')}
-
-{json.dumps(decision, indent=2)}
-===================
-"""
+            messaging = resolution.get("stakeholder_messaging", {})
+            view.update(
+                conflict_type=decision.get("conflict_type", "Unknown"),
+                project_id=decision.get("project_id", "Unknown"),
+                decision=resolution.get("decision", "Unknown"),
+                timeline_adjustment=resolution.get("timeline_adjustment", "None"),
+                scope_adjustment=resolution.get("scope_adjustment", "None"),
+                executive_summary=resolution.get("executive_summary", "No summary provided"),
+                ethical_justification=decision.get("ethical_justification", "No justification provided"),
+                msg_team=messaging.get("team", "N/A"),
+                msg_business=messaging.get("business", "N/A"),
+                msg_customer=messaging.get("customer", "N/A")
+            )
+            return _CONFLICT_SUMMARY_TMPL.format_map(view)
         
-        return summary
+        view.update(
+            decision_type=decision_type,
+            raw=_dumps(decision, option=orjson.OPT_INDENT_2, default=str).decode()
+        )
+        return _GENERIC_SUMMARY_TMPL.format_map(view)
 
 
 # Create singleton instance
@@ -2,26 +2,116 @@
 Decision Service - Core business logic for AI decision making
 """
 import logging
-import json
 import asyncio
+import orjson
+import time
+from collections import OrderedDict
 from typing import Dict, Any, List
-from agents.data_agent import data_agent
+from agents.data_agent import get_data_agent
 from workflows.decision_workflow import decision_workflow
 from workflows.conflict_resolution_workflow import conflict_resolution_workflow
 from services.decision_logger import decision_logger
 
 logger = logging.getLogger(__name__)
 
+# Parsed performance-review LLM output is reused for this long before the
+# model is asked again about the same user/period/metrics snapshot
+_REVIEW_CACHE_TTL = 300.0
+_REVIEW_CACHE_MAX = 512
+
+# The /users and /tasks snapshots are shared across concurrent requests for
+# this long; long enough to collapse duplicate fetches inside one burst,
+# short enough that assignments land on fresh workloads
+_FETCH_CACHE_TTL = 2.0
+
+# Conflict resolutions for an identical conflict shape (type, priorities,
+# tasks, pressure and team-wellbeing snapshot) are reused for this long
+# before the workflow runs again
+_CONFLICT_CACHE_TTL = 300.0
+_CONFLICT_CACHE_MAX = 128
+
 
 class DecisionService:
     """Service for handling AI-powered task assignment decisions"""
     
     def __init__(self):
-        self.data_agent = data_agent
+        self.data_agent = get_data_agent()
         self.workflow = decision_workflow
         self.conflict_workflow = conflict_resolution_workflow
         self.logger = decision_logger
+        # TTL + LRU cache of parsed review LLM output, keyed by user, period
+        # and the exact metrics snapshot; dashboard refreshes of an unchanged
+        # review become a dict lookup instead of a multi-second LLM call
+        self._review_cache: OrderedDict = OrderedDict()
+        # Exact-match cache of formatted conflict resolutions, keyed by the
+        # full conflict shape; recurring conflicts skip the whole workflow
+        self._conflict_cache: OrderedDict = OrderedDict()
+        # Single-flight TTL memoization for the two hot read-only fetches:
+        # a lock makes concurrent misses share one request instead of
+        # stampeding the backend
+        self._users_cache = (0.0, None)
+        self._tasks_cache = (0.0, None)
+        self._users_lock = asyncio.Lock()
+        self._tasks_lock = asyncio.Lock()
+        # LLM client is stateless here; constructed once on first use so
+        # reviews reuse its connection pool instead of rebuilding it per call
+        self._llm = None
     
+    def _get_llm(self):
+        if self._llm is None:
+            from utils.llm_factory import create_llm
+            self._llm = create_llm()
+        return self._llm
+
+    async def _get_users(self) -> List[Dict[str, Any]]:
+        ts, users = self._users_cache
+        if users is not None and time.monotonic() - ts < _FETCH_CACHE_TTL:
+            return users
+        async with self._users_lock:
+            ts, users = self._users_cache
+            if users is not None and time.monotonic() - ts < _FETCH_CACHE_TTL:
+                return users
+            users = await self.data_agent.fetch_users()
+            self._users_cache = (time.monotonic(), users)
+            return users
+
+    async def _get_tasks(self) -> List[Dict[str, Any]]:
+        ts, tasks = self._tasks_cache
+        if tasks is not None and time.monotonic() - ts < _FETCH_CACHE_TTL:
+            return tasks
+        async with self._tasks_lock:
+            ts, tasks = self._tasks_cache
+            if tasks is not None and time.monotonic() - ts < _FETCH_CACHE_TTL:
+                return tasks
+            tasks = await self.data_agent.fetch_tasks()
+            self._tasks_cache = (time.monotonic(), tasks)
+            return tasks
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key, ttl: float):
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        ts, value = entry
+        if time.monotonic() - ts > ttl:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value, maxsize: int):
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > maxsize:
+            cache.popitem(last=False)
+
+    def _review_cache_get(self, key):
+        return self._cache_get(self._review_cache, key, _REVIEW_CACHE_TTL)
+
+    def _review_cache_put(self, key, value):
+        self._cache_put(self._review_cache, key, value, _REVIEW_CACHE_MAX)
+
     async def make_task_assignment_decision(self, task_id: int) -> Dict[str, Any]:
         """
         Make an AI-powered decision for task assignment
@@ -48,23 +138,23 @@ class DecisionService:
             # Step 2: Run the decision workflow (GoT reasoning with LangGraph)
             logger.info("Running decision workflow...")
             try:
-                # Run the synchronous/blocking workflow in a separate thread to avoid blocking the event loop.
+                # The workflow is blocking, so run it in a thread; no nested
+                # event loop, which kept breaking reuse of shared clients.
                 result = await asyncio.wait_for(
-                    asyncio.to_thread(lambda: asyncio.run(self.workflow.run(task, users, teams))),
+                    asyncio.to_thread(self.workflow.run, task, users, teams),
                     timeout=60.0
                 )
             except asyncio.TimeoutError:
                 logger.error("Decision workflow timed out")
                 raise
             
-            # Step 3: Find assigned user details
+            # Step 3: Find assigned user details (dict lookup, not a scan
+            # that string-coerces every id on the way past)
             final_decision = result.get("decision", {})
             assigned_user_id = final_decision.get("final_user_id", "")
-            
-            assigned_user = next(
-                (u for u in users if str(u["id"]) == str(assigned_user_id)),
-                None
-            )
+
+            users_by_id = {str(u["id"]): u for u in users}
+            assigned_user = users_by_id.get(str(assigned_user_id))
             
             # Step 4: Format the response
             response = {
@@ -136,19 +226,24 @@ class DecisionService:
         try:
             logger.info(f"Resolving conflict: {conflict_type} for project {project_id}")
             
-            # Step 1: Collect data
-            # Get project details
-            project = await self.data_agent.fetch_project(project_id)
-            
-            # Get tasks involved in conflict
-            tasks = []
-            for task_id in task_ids:
-                task_context = await self.data_agent.collect_decision_context(task_id)
-                tasks.append(task_context["task"])
-            
-            # Get team details
+            # Step 1: Collect data concurrently. The project, the user list
+            # and the per-task contexts are independent, so one gather fans
+            # them all out; a semaphore keeps the per-task fan-out bounded.
+            semaphore = asyncio.Semaphore(8)
+
+            async def collect_context(tid: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.data_agent.collect_decision_context(tid)
+
+            project, users, *task_contexts = await asyncio.gather(
+                self.data_agent.fetch_project(project_id),
+                self._get_users(),
+                *(collect_context(task_id) for task_id in task_ids)
+            )
+            tasks = [context["task"] for context in task_contexts]
+
+            # Get team details (needs the project's teamId, so after the gather)
             team = await self.data_agent.fetch_team(project.get("teamId"))
-            users = await self.data_agent.fetch_users()
             
             # Calculate team wellbeing factors
             team_wellbeing_factors = {
@@ -158,6 +253,21 @@ class DecisionService:
                 "quality_concerns": quality_concerns or []
             }
             
+            # An identical conflict shape resolved within the TTL reuses
+            # the formatted result instead of re-running the workflow
+            cache_key = (
+                conflict_type,
+                project_id,
+                tuple(sorted(task_ids)),
+                tuple(sorted(business_priorities)),
+                deadline_pressure,
+                orjson.dumps(team_wellbeing_factors, option=orjson.OPT_SORT_KEYS)
+            )
+            cached = self._cache_get(self._conflict_cache, cache_key, _CONFLICT_CACHE_TTL)
+            if cached is not None:
+                logger.info(f"Conflict resolution cache hit for project {project_id}")
+                return dict(cached, cached=True)
+
             # Step 2: Run conflict resolution workflow
             logger.info("Running conflict resolution workflow...")
             result = await self.conflict_workflow.run(
@@ -202,6 +312,8 @@ class DecisionService:
             )
             
             response["decision_id"] = decision_id
+            self._cache_put(self._conflict_cache, cache_key, response,
+                            _CONFLICT_CACHE_MAX)
             
             logger.info(f"Conflict resolution complete, logged as {decision_id}")
             return response
@@ -210,63 +322,15 @@ class DecisionService:
             logger.error(f"Error resolving conflict: {e}", exc_info=True)
             raise
     
-    async def get_performance_review(
+    async def _generate_review(
         self,
+        user: Dict[str, Any],
         user_id: int,
-        review_period: str = "monthly",
-        include_peer_feedback: bool = True
+        review_period: str,
+        metrics: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """
-        Get AI-powered performance review for a user
-        Use Case 3: Performance Evaluation and Recognition
-        
-        Args:
-            user_id: ID of the user to review
-            review_period: Review period (weekly, monthly, quarterly)
-            include_peer_feedback: Include peer feedback in analysis
-            
-        Returns:
-            Performance review analysis with recognition recommendations
-        """
-        try:
-            logger.info(f"Generating performance review for user {user_id}")
-            
-            # Step 1: Collect user data
-            users = await self.data_agent.fetch_users()
-            user = next((u for u in users if u["id"] == user_id), None)
-            
-            if not user:
-                raise ValueError(f"User {user_id} not found")
-            
-            # Step 2: Get user's task history
-            tasks = await self.data_agent.fetch_tasks()
-            user_tasks = [t for t in tasks if t.get("assignedUserId") == user_id]
-            
-            # Step 3: Calculate metrics
-            total_tasks = len(user_tasks)
-            completed_tasks = len([t for t in user_tasks if t.get("status") == "completed"])
-            task_completion_rate = completed_tasks / total_tasks if total_tasks > 0 else 0
-            
-            # Average complexity (assuming complexity is stored in task)
-            avg_complexity = sum(t.get("complexity", 5) for t in user_tasks) / total_tasks if total_tasks > 0 else 5
-            
-            # Compare to team average
-            all_users_workload = [u.get("workload", 0) for u in users]
-            avg_workload = sum(all_users_workload) / len(all_users_workload) if all_users_workload else 0
-            user_workload = user.get("workload", 0)
-            
-            metrics = {
-                "task_completion_rate": round(task_completion_rate, 2),
-                "avg_complexity": round(avg_complexity, 1),
-                "total_tasks": total_tasks,
-                "completed_tasks": completed_tasks,
-                "current_workload": user_workload,
-                "team_avg_workload": round(avg_workload, 1),
-                "workload_vs_average": round(user_workload - avg_workload, 1)
-            }
-            
-            # Step 4: Use LLM to generate review and recommendations
-            prompt = f"""
+        """Invoke the LLM for a performance review and parse its JSON output"""
+        prompt = f"""
 You are a Performance Review AI Agent.
 Generate a fair, unbiased performance review for the following user.
 
@@ -274,14 +338,8 @@ USER: {user.get('name')} (ID: {user_id})
 ROLE: {user.get('role', 'Developer')}
 REVIEW PERIOD: {review_period}
 
-METRICS:
-{json.dumps(metrics, indent=2)}
-
-TASKS COMPLETED: {completed_tasks}/{total_tasks}
-TASK COMPLETION RATE: {task_completion_rate:.2%}
-AVERAGE TASK COMPLEXITY: {avg_complexity}/10
-CURRENT WORKLOAD: {user_workload} tasks
-TEAM AVERAGE WORKLOAD: {avg_workload:.1f} tasks
+METRICS (task counts, completion rate, complexity and workload vs team average):
+{orjson.dumps(metrics, option=orjson.OPT_INDENT_2).decode()}
 
 Provide:
 1. Overall recommendation (recognition|continue|improvement_needed)
@@ -311,15 +369,91 @@ Return as JSON:
     }}
 }}
 """
+
+        from utils.llm_utils import invoke_llm_with_timeout
+
+        llm = self._get_llm()
+        response = await invoke_llm_with_timeout(llm, prompt, timeout=30.0)
+        content = getattr(response, "content", str(response))
+
+        return orjson.loads(content)
+
+    async def get_performance_review(
+        self,
+        user_id: int,
+        review_period: str = "monthly"
+    ) -> Dict[str, Any]:
+        """
+        Get AI-powered performance review for a user
+        Use Case 3: Performance Evaluation and Recognition
+        
+        Args:
+            user_id: ID of the user to review
+            review_period: Review period (weekly, monthly, quarterly)
             
-            from utils.llm_factory import create_llm
-            from utils.llm_utils import invoke_llm_with_timeout
+        Returns:
+            Performance review analysis with recognition recommendations
+        """
+        try:
+            logger.info(f"Generating performance review for user {user_id}")
+            
+            # Step 1: Collect user and task data concurrently (independent
+            # endpoints, so the second round-trip overlaps the first)
+            users, tasks = await asyncio.gather(
+                self._get_users(),
+                self._get_tasks()
+            )
+
+            # Step 2: One pass over users locates the target and accumulates
+            # the team workload for the average
+            user = None
+            workload_total = 0
+            for u in users:
+                workload_total += u.get("workload", 0)
+                if u["id"] == user_id:
+                    user = u
+
+            if not user:
+                raise ValueError(f"User {user_id} not found")
 
-            llm = create_llm()
-            response = await invoke_llm_with_timeout(llm, prompt, timeout=30.0)
-            content = getattr(response, "content", str(response))
+            # Step 3: One pass over tasks counts, tallies completions and
+            # sums complexity for the user's history
+            total_tasks = 0
+            completed_tasks = 0
+            complexity_sum = 0
+            for t in tasks:
+                if t.get("assignedUserId") != user_id:
+                    continue
+                total_tasks += 1
+                if t.get("status") == "completed":
+                    completed_tasks += 1
+                complexity_sum += t.get("complexity", 5)
 
-            review_result = json.loads(content)
+            task_completion_rate = completed_tasks / total_tasks if total_tasks > 0 else 0
+            avg_complexity = complexity_sum / total_tasks if total_tasks > 0 else 5
+            avg_workload = workload_total / len(users) if users else 0
+            user_workload = user.get("workload", 0)
+            
+            metrics = {
+                "task_completion_rate": round(task_completion_rate, 2),
+                "avg_complexity": round(avg_complexity, 1),
+                "total_tasks": total_tasks,
+                "completed_tasks": completed_tasks,
+                "current_workload": user_workload,
+                "team_avg_workload": round(avg_workload, 1),
+                "workload_vs_average": round(user_workload - avg_workload, 1)
+            }
+            
+            # Step 4: Use LLM to generate review and recommendations.
+            # Identical user/period/metrics snapshots within the TTL reuse
+            # the parsed result instead of re-invoking the model.
+            cache_key = (user_id, review_period, orjson.dumps(metrics, option=orjson.OPT_SORT_KEYS))
+            review_result = self._review_cache_get(cache_key)
+            if review_result is None:
+                review_result = await self._generate_review(
+                    user, user_id, review_period, metrics
+                )
+                self._review_cache_put(cache_key, review_result)
             
             # Step 5: Format response
             response_data = {
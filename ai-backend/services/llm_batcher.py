@@ -0,0 +1,109 @@
+"""
+Async micro-batcher for LLM invocations
+
+Coalesces concurrent LLM calls arriving within a short window into a single
+dispatch. Each request's per-call overhead (thread handoff, HTTP setup,
+provider queuing) is amortized across the batch: queued prompts are sorted by
+length and submitted together via asyncio.gather over the shared client, so
+bursts of decision requests no longer serialize one call at a time.
+"""
+import asyncio
+import logging
+from typing import Any, List, Optional, Tuple
+
+from utils.llm_utils import invoke_llm_with_timeout
+
+logger = logging.getLogger(__name__)
+
+# Max time a request waits for batch-mates before dispatch (seconds)
+BATCH_WAIT_S = 0.03
+# Max prompts dispatched in one batch
+MAX_BATCH = 8
+
+
+class AsyncBatcher:
+    """Accumulates (llm, prompt) submissions and dispatches them in batches
+
+    A background worker drains the queue, waiting up to BATCH_WAIT_S for
+    additional prompts (or until MAX_BATCH are queued), then resolves every
+    submission concurrently. The configured provider has no multi-prompt
+    endpoint, so a "batch" is one gathered round of calls over the shared
+    pooled client rather than a single combined request.
+    """
+
+    def __init__(self):
+        self._queue: asyncio.Queue[Tuple[Any, str, Optional[float], Optional[str], int, bool, asyncio.Future]] = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background dispatch worker (idempotent)"""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+            logger.info("LLM batcher started (window=%dms, max_batch=%d)",
+                        int(BATCH_WAIT_S * 1000), MAX_BATCH)
+
+    async def stop(self):
+        """Cancel the dispatch worker and fail any queued submissions"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        while not self._queue.empty():
+            _, _, _, _, _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("LLM batcher stopped"))
+
+    async def submit(self, llm: Any, prompt: str, timeout: Optional[float] = None,
+                     system: Optional[str] = None, retries: int = 0,
+                     json_mode: bool = False) -> Any:
+        """Queue a prompt for batched dispatch and await its result
+
+        Falls back to a direct invocation if the worker is not running
+        (e.g. callers outside the FastAPI app lifecycle).
+        """
+        if self._worker is None or self._worker.done():
+            return await invoke_llm_with_timeout(llm, prompt, timeout=timeout, system=system,
+                                                 retries=retries, json_mode=json_mode)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((llm, prompt, timeout, system, retries, json_mode, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + BATCH_WAIT_S
+            while len(batch) < MAX_BATCH:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[Tuple[Any, str, Optional[float], Optional[str], int, bool, asyncio.Future]]):
+        # Shorter prompts first so quick calls aren't stuck behind long ones
+        batch.sort(key=lambda item: len(item[1]))
+        if len(batch) > 1:
+            logger.debug("Dispatching LLM batch of %d prompts", len(batch))
+        results = await asyncio.gather(
+            *(invoke_llm_with_timeout(llm, prompt, timeout=timeout, system=system,
+                                      retries=retries, json_mode=json_mode)
+              for llm, prompt, timeout, system, retries, json_mode, _ in batch),
+            return_exceptions=True
+        )
+        for (_, _, _, _, _, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+# Global batcher instance
+llm_batcher = AsyncBatcher()
@@ -29,5 +29,10 @@ if __name__ == "__main__":
         host=settings.fastapi_host,
         port=settings.fastapi_port,
         reload=False,
-        log_level="debug"
+        log_level="debug",
+        # uvicorn[standard] ships uvloop and httptools; request them
+        # explicitly so the faster event loop and HTTP parser are always used
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=30
     )
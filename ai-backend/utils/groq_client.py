@@ -1,4 +1,5 @@
 import httpx
+import json
 import logging
 from typing import Any
 from config.settings import settings
@@ -20,18 +21,65 @@ class GroqClient:
         if not self.api_key or not self.api_url:
             logger.warning("GroqClient created without API key or URL configured")
 
-    def invoke(self, prompt: str) -> Any:
+    def invoke(self, prompt: str, system: str = None, json_mode: bool = False) -> Any:
         if not self.api_key or not self.api_url:
             raise RuntimeError("Groq API key or URL not configured (set GROQ_API_KEY and GROQ_API_URL)")
 
         headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-        # Use proper Groq/OpenAI-compatible chat completion format
+        # Use proper Groq/OpenAI-compatible chat completion format. A separate
+        # byte-stable system message lets providers with automatic prefix
+        # caching reuse the prefill for the static instruction block.
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
         payload = {
             "model": settings.llm_model,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": messages,
             "temperature": settings.llm_temperature
         }
+        if json_mode:
+            # Provider-side JSON mode: the model emits a bare JSON object, so
+            # prompts can drop the "return only JSON" scaffolding and parsing
+            # needs no fence stripping
+            payload["response_format"] = {"type": "json_object"}
 
+        # Prefer streaming: content is consumed as it arrives, and the stream
+        # is cut off as soon as the END_JSON marker appears instead of waiting
+        # for the provider to finish generating trailing tokens
+        try:
+            return self._invoke_streaming(headers, payload)
+        except httpx.HTTPError:
+            logger.warning("Groq streaming request failed; retrying without streaming")
+            return self._invoke_blocking(headers, payload)
+
+    def _invoke_streaming(self, headers: dict, payload: dict) -> Any:
+        payload = dict(payload, stream=True)
+        pieces = []
+        tail = ""
+        with httpx.Client(timeout=settings.llm_timeout + 5.0) as client:
+            with client.stream("POST", self.api_url, headers=headers, json=payload) as resp:
+                resp.raise_for_status()
+                for line in resp.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        delta = json.loads(data)['choices'][0].get('delta', {}).get('content')
+                    except (json.JSONDecodeError, KeyError, IndexError):
+                        continue
+                    if not delta:
+                        continue
+                    pieces.append(delta)
+                    # Rolling tail keeps the marker check O(1) per chunk
+                    tail = (tail + delta)[-32:]
+                    if '<<<END_JSON>>>' in tail:
+                        break
+        return SimpleResp(''.join(pieces))
+
+    def _invoke_blocking(self, headers: dict, payload: dict) -> Any:
         # Use small timeout here; the outer invoke_llm_with_timeout will run this in a thread
         with httpx.Client(timeout=settings.llm_timeout + 5.0) as client:
             resp = client.post(self.api_url, headers=headers, json=payload)
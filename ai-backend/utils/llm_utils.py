@@ -8,19 +8,37 @@ from config.settings import settings
 logger = logging.getLogger(__name__)
 
 
-async def invoke_llm_with_timeout(llm: Any, prompt: str, timeout: float | None = None) -> Any:
+async def invoke_llm_with_timeout(llm: Any, prompt: str, timeout: float | None = None,
+                                  system: str | None = None, retries: int = 0,
+                                  json_mode: bool = False) -> Any:
     """Invoke a blocking LLM call in a thread with a timeout.
 
     Runs `llm.invoke(prompt)` inside a thread to avoid blocking the event loop,
     and enforces a timeout so HTTP handlers don't hang indefinitely.
     Raises TimeoutError on timeout. The default timeout will come from settings.llm_timeout.
+
+    With `retries` > 0, a timed-out call is retried up to that many times
+    before the TimeoutError surfaces: a short timeout plus retry cancels
+    slow-tail calls instead of letting one blocked request hold the handler
+    for the full window.
     """
     timeout = timeout if timeout is not None else settings.llm_timeout
     start = time.time()
     logger.debug("LLM invoke start: timeout=%s, prompt_len=%d", timeout, len(prompt) if isinstance(prompt, str) else 0)
 
     try:
-        result = await asyncio.wait_for(asyncio.to_thread(lambda: llm.invoke(prompt)), timeout)
+        for attempt in range(retries + 1):
+            try:
+                if system is not None or json_mode:
+                    result = await asyncio.wait_for(
+                        asyncio.to_thread(lambda: llm.invoke(prompt, system=system, json_mode=json_mode)), timeout)
+                else:
+                    result = await asyncio.wait_for(asyncio.to_thread(lambda: llm.invoke(prompt)), timeout)
+                break
+            except asyncio.TimeoutError:
+                if attempt == retries:
+                    raise
+                logger.warning("LLM invocation timed out after %ss; retry %d/%d", timeout, attempt + 1, retries)
         duration = time.time() - start
         logger.info("LLM invoke completed in %.2fs", duration)
 
@@ -433,10 +433,14 @@ Write in 4-6 clear paragraphs, suitable for a project manager to understand and
         
         return state
     
-    async def run(self, task: Dict[str, Any], users: list, teams: list) -> Dict[str, Any]:
+    def run(self, task: Dict[str, Any], users: list, teams: list) -> Dict[str, Any]:
         """
         Run the complete decision workflow
-        
+
+        Blocking: the compiled graph and its agent nodes are synchronous, so
+        callers on the event loop should dispatch this through
+        asyncio.to_thread rather than spinning up a nested loop.
+
         Args:
             task: Task dictionary
             users: List of user dictionaries